@@ -9,10 +9,13 @@ class AIClientInterface(ABC):
     AI service providers.
     """
 
-    @abstractmethod
     def create_completion(self, user_message, is_json=False):
         """Creates a completion using the AI service.
 
+        Thin compatibility shim that dispatches to the specialized
+        create_completion_text / create_completion_json methods, which
+        avoid the per-call format branch in their hot paths.
+
         Args:
             user_message (str): The user's input message or query.
             is_json (bool, optional): Flag indicating if the response should be in JSON format.
@@ -20,6 +23,88 @@ class AIClientInterface(ABC):
 
         Returns:
             str: The AI-generated completion response.
+        """
+        if is_json:
+            return self.create_completion_json(user_message)
+        return self.create_completion_text(user_message)
+
+    def invalidate_completion_cache(self, user_message, is_json=False):
+        """Drops any cached response for a request.
+
+        No-op by default; implementations backed by a response cache
+        override this so callers can force a fresh completion when a
+        cached response proved unusable.
+
+        Args:
+            user_message (str): The user's input message or query.
+            is_json (bool, optional): Flag indicating if the response should be in JSON format.
+                Defaults to False.
+        """
+        pass
+
+    @abstractmethod
+    def create_completion_text(self, user_message):
+        """Creates a plain-text completion using the AI service.
+
+        Args:
+            user_message (str): The user's input message or query.
+
+        Returns:
+            str: The AI-generated completion response.
+
+        Raises:
+            NotImplementedError: This is an abstract method that must be implemented
+                by concrete classes.
+        """
+        pass
+
+    @abstractmethod
+    def create_completion_json(self, user_message):
+        """Creates a JSON-format completion using the AI service.
+
+        Args:
+            user_message (str): The user's input message or query.
+
+        Returns:
+            str: The AI-generated completion response, expected to contain JSON.
+
+        Raises:
+            NotImplementedError: This is an abstract method that must be implemented
+                by concrete classes.
+        """
+        pass
+
+    @abstractmethod
+    def create_completion_stream(self, user_message, is_json=False):
+        """Streams a completion from the AI service as it is generated.
+
+        Args:
+            user_message (str): The user's input message or query.
+            is_json (bool, optional): Flag indicating if the response should be in JSON format.
+                Defaults to False.
+
+        Yields:
+            str: Chunks of the AI-generated completion response.
+
+        Raises:
+            NotImplementedError: This is an abstract method that must be implemented
+                by concrete classes.
+        """
+        pass
+
+    @abstractmethod
+    def create_completions_batch(self, user_messages, is_json=False, max_concurrency=50):
+        """Creates several completions concurrently using the AI service.
+
+        Args:
+            user_messages (list): List of user input messages or queries.
+            is_json (bool, optional): Flag indicating if the responses should be in JSON format.
+                Defaults to False.
+            max_concurrency (int, optional): Maximum number of requests in flight at once.
+                Defaults to 50.
+
+        Returns:
+            list: The AI-generated completion responses, in the same order as the input.
 
         Raises:
             NotImplementedError: This is an abstract method that must be implemented
@@ -1,5 +1,17 @@
 # src/adapters/anthropic_client.py
-from anthropic import Anthropic
+from anthropic import (
+    Anthropic,
+    AsyncAnthropic,
+    APIConnectionError,
+    APIStatusError,
+    RateLimitError,
+)
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 from src.adapters.base_ai_client import BaseAIClient
 from src.config.config_loader import ConfigLoader
 from src.config.anthropic_credentials_manager import AnthropicCredentialsManager
@@ -14,6 +26,9 @@ class AnthropicClient(BaseAIClient):
     with Anthropic Claude services for text generation.
     """
 
+    # Opt into Anthropic server-side prompt caching
+    _PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
     def __init__(self, config_loader: ConfigLoader, prompt_key: str):
         """
         Initialize the Anthropic client.
@@ -22,11 +37,30 @@ class AnthropicClient(BaseAIClient):
             config_loader (ConfigLoader): Configuration loader instance.
             prompt_key (str): Key for the prompt to be loaded.
         """
-        self.model = config_loader.get_config_value(
+        self.model = config_loader.get_config_attr(
             "anthropic_model", "claude-3-opus-20240229"
         )
         super().__init__(config_loader, prompt_key)
 
+        # Mark the system prompt as cacheable: every completion from this
+        # client reuses the same prefix, so the server caches it instead of
+        # reprocessing (and charging for) it on each request. The request
+        # parameters are per-call invariant, so pre-assemble them once.
+        self._system_blocks = [
+            {
+                "type": "text",
+                "text": self.system_message,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        self._base_kwargs = {
+            "model": self.model,
+            "system": self._system_blocks,
+            "temperature": 0,
+            "max_tokens": 4000,
+            "extra_headers": self._PROMPT_CACHING_HEADERS,
+        }
+
     def get_credentials_manager(self) -> CredentialsManagerInterface:
         """
         Return the Anthropic credentials manager.
@@ -43,29 +77,87 @@ class AnthropicClient(BaseAIClient):
         Returns:
             Anthropic: Initialized Anthropic API client.
         """
-        return Anthropic(api_key=self.api_key)
+        return Anthropic(
+            api_key=self.api_key, http_client=self._get_sync_http_client()
+        )
+
+    def initialize_async_client(self):
+        """
+        Initialize the asynchronous Anthropic API client.
 
-    def create_completion(self, user_message, is_json=False):
+        Returns:
+            AsyncAnthropic: Initialized asynchronous Anthropic API client.
         """
-        Create a completion using the Anthropic API.
+        return AsyncAnthropic(
+            api_key=self.api_key, http_client=self._get_http_client()
+        )
+
+    def _request_completion(self, user_message, is_json):
+        """
+        Perform the actual Anthropic API call.
 
         Args:
             user_message (str): User message.
-            is_json (bool, optional): If True, requests response in JSON format.
-                Defaults to False.
+            is_json (bool): If True, requests response in JSON format.
 
         Returns:
             str: Anthropic API response.
         """
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                system=self.system_message,
-                messages=[{"role": "user", "content": user_message}],
-                temperature=0,
-                max_tokens=4000,
-            )
-            return response.content[0].text
+            return "".join(self.create_completion_stream(user_message, is_json))
         except Exception as e:
             print(f"\n\nError creating Anthropic completion: {e}")
             return ""
+
+    def create_completion_stream(self, user_message, is_json=False):
+        """
+        Stream a completion from the Anthropic API as it is generated.
+
+        Yields the response text incrementally, so downstream processing
+        can overlap with generation instead of blocking on the full
+        completion.
+
+        Args:
+            user_message (str): User message.
+            is_json (bool, optional): If True, requests response in JSON format.
+                Defaults to False.
+
+        Yields:
+            str: Chunks of the Anthropic API response.
+        """
+        with self.client.messages.stream(
+            messages=[{"role": "user", "content": user_message}],
+            **self._base_kwargs,
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
+
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential_jitter(1, 30),
+        retry=retry_if_exception_type(
+            (RateLimitError, APIStatusError, APIConnectionError)
+        ),
+    )
+    async def _acreate(self, user_message, is_json=False):
+        """
+        Create a completion using the asynchronous Anthropic API client.
+
+        Transient failures (rate limits, 5xx responses, network errors) are
+        retried with exponential backoff, and the call is rate limited to
+        respect the configured requests-per-minute ceiling.
+
+        Args:
+            user_message (str): User message.
+            is_json (bool, optional): If True, requests response in JSON format.
+                Defaults to False.
+
+        Returns:
+            str: Anthropic API response.
+        """
+        async with self._limiter:
+            response = await self.async_client.messages.create(
+                messages=[{"role": "user", "content": user_message}],
+                **self._base_kwargs,
+            )
+        return response.content[0].text
@@ -1,5 +1,10 @@
 # src/adapters/base_ai_client.py
+import asyncio
+import hashlib
+import httpx
 from abc import ABC, abstractmethod
+from aiolimiter import AsyncLimiter
+from src.adapters.response_cache import ResponseCache
 from src.adapters.ai_client_interface import AIClientInterface
 from src.config.config_loader import ConfigLoader
 from src.config.credentials_manager_interface import CredentialsManagerInterface
@@ -13,6 +18,45 @@ class BaseAIClient(AIClientInterface):
     and defines abstract methods that concrete classes must implement.
     """
 
+    # Shared HTTP clients so all AI client instances reuse one connection
+    # pool (keep-alive) instead of paying a TLS handshake each
+    _http_client = None
+    _sync_http_client = None
+
+    @classmethod
+    def _get_http_client(cls):
+        """
+        Lazily create the HTTP client shared by all async SDK clients.
+
+        Returns:
+            httpx.AsyncClient: The shared HTTP client.
+        """
+        if BaseAIClient._http_client is None:
+            BaseAIClient._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=200, max_keepalive_connections=100
+                ),
+                timeout=60,
+            )
+        return BaseAIClient._http_client
+
+    @classmethod
+    def _get_sync_http_client(cls):
+        """
+        Lazily create the HTTP client shared by all sync SDK clients.
+
+        Returns:
+            httpx.Client: The shared HTTP client.
+        """
+        if BaseAIClient._sync_http_client is None:
+            BaseAIClient._sync_http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=64, max_keepalive_connections=32
+                ),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            )
+        return BaseAIClient._sync_http_client
+
     def __init__(self, config_loader: ConfigLoader, prompt_key: str):
         """
         Initialize the base AI client.
@@ -24,12 +68,46 @@ class BaseAIClient(AIClientInterface):
         # Load prompt from YAML file
         self.system_message = config_loader.load_prompt(prompt_key)
 
-        # Get credentials
-        self.credentials = self.get_credentials_manager().get_credentials()
-        self.api_key = self.credentials.get("api_key")
+        # Get the API key
+        self.api_key = self.get_credentials_manager().get_credentials()
 
-        # Initialize API client
+        # Initialize API clients (sync and async)
         self.client = self.initialize_client()
+        self.async_client = self.initialize_async_client()
+
+        # Rate limiter to stay under the provider's requests-per-minute ceiling
+        self.rpm = config_loader.get_config_attr("rpm", 500)
+        self._limiter = AsyncLimiter(self.rpm, 60)
+
+        # Persistent response cache keyed by the request content
+        self.cache = ResponseCache(
+            config_loader.get_config_attr("cache_path", ".llm_cache.db")
+        )
+
+    def build_cache_key(self, user_message, is_json):
+        """
+        Build the cache key for a completion request.
+
+        Only parameters that affect the output enter the key: model,
+        system message, user message and the JSON flag.
+
+        Args:
+            user_message (str): User message.
+            is_json (bool): Flag indicating if the response should be in JSON format.
+
+        Returns:
+            bytes: SHA-256 digest identifying the request.
+        """
+        return hashlib.sha256(
+            b"|".join(
+                [
+                    self.model.encode(),
+                    self.system_message.encode(),
+                    user_message.encode(),
+                    bytes([is_json]),
+                ]
+            )
+        ).digest()
 
     @abstractmethod
     def get_credentials_manager(self) -> CredentialsManagerInterface:
@@ -52,9 +130,87 @@ class BaseAIClient(AIClientInterface):
         pass
 
     @abstractmethod
-    def create_completion(self, user_message, is_json=False):
+    def initialize_async_client(self):
+        """
+        Initialize the asynchronous API client.
+
+        Returns:
+            object: Initialized asynchronous API client.
+        """
+        pass
+
+    def _cached_completion(self, user_message, is_json):
+        """
+        Serve a completion from the cache, calling the API on a miss.
+
+        Args:
+            user_message (str): User message.
+            is_json (bool): Flag indicating if the response should be in JSON format.
+
+        Returns:
+            str: API response.
+        """
+        cache_key = self.build_cache_key(user_message, is_json)
+        return self.cache.get_or_compute(
+            cache_key, lambda: self._request_completion(user_message, is_json)
+        )
+
+    def invalidate_completion_cache(self, user_message, is_json=False):
+        """
+        Drop the cached response for a request.
+
+        Used when a cached completion turned out to be unusable (for
+        example, unparseable JSON), so the retry reaches the API instead
+        of being served the same bad response again.
+
+        Args:
+            user_message (str): User message.
+            is_json (bool, optional): Flag indicating if the response should be in JSON format.
+        """
+        self.cache.delete(self.build_cache_key(user_message, is_json))
+
+    def create_completion_text(self, user_message):
+        """
+        Create a plain-text completion using the API.
+
+        Args:
+            user_message (str): User message.
+
+        Returns:
+            str: API response.
+        """
+        return self._cached_completion(user_message, False)
+
+    def create_completion_json(self, user_message):
+        """
+        Create a JSON-format completion using the API.
+
+        Args:
+            user_message (str): User message.
+
+        Returns:
+            str: API response, expected to contain JSON.
+        """
+        return self._cached_completion(user_message, True)
+
+    @abstractmethod
+    def _request_completion(self, user_message, is_json):
+        """
+        Perform the actual API call.
+
+        Args:
+            user_message (str): User message.
+            is_json (bool): Flag indicating if the response should be in JSON format.
+
+        Returns:
+            str: API response.
+        """
+        pass
+
+    @abstractmethod
+    async def _acreate(self, user_message, is_json=False):
         """
-        Create a completion using the API.
+        Create a completion using the asynchronous API client.
 
         Args:
             user_message (str): User message.
@@ -64,3 +220,60 @@ class BaseAIClient(AIClientInterface):
             str: API response.
         """
         pass
+
+    def create_completions_batch(self, user_messages, is_json=False, max_concurrency=50):
+        """
+        Create several completions concurrently using the asynchronous API client.
+
+        The calls are network-bound, so fanning them out with asyncio multiplies
+        throughput compared to calling create_completion in a loop.
+
+        Byte-identical messages are sent to the API only once; the shared
+        response is scattered back to every position in the result.
+
+        Args:
+            user_messages (list): List of user messages.
+            is_json (bool, optional): Flag indicating if the responses should be in JSON format.
+            max_concurrency (int, optional): Maximum number of requests in flight at once.
+
+        Returns:
+            list: API responses, in the same order as user_messages.
+        """
+        # Deduplicate identical prompts, remembering each message's slot
+        unique = {}
+        idx_map = [
+            unique.setdefault(user_message, len(unique))
+            for user_message in user_messages
+        ]
+
+        unique_results = asyncio.run(
+            self._gather_completions(list(unique), is_json, max_concurrency)
+        )
+
+        return [unique_results[i] for i in idx_map]
+
+    async def _gather_completions(self, user_messages, is_json, max_concurrency):
+        """
+        Gather completions for all messages, bounded by a semaphore.
+
+        Args:
+            user_messages (list): List of user messages.
+            is_json (bool): Flag indicating if the responses should be in JSON format.
+            max_concurrency (int): Maximum number of requests in flight at once.
+
+        Returns:
+            list: API responses, in the same order as user_messages.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded_create(user_message):
+            async with semaphore:
+                try:
+                    return await self._acreate(user_message, is_json)
+                except Exception as e:
+                    print(f"\n\nError creating batch completion: {e}")
+                    return ""
+
+        return await asyncio.gather(
+            *(bounded_create(user_message) for user_message in user_messages)
+        )
@@ -1,5 +1,17 @@
 # src/adapters/openai_client.py
-from openai import OpenAI
+from openai import (
+    OpenAI,
+    AsyncOpenAI,
+    APIConnectionError,
+    APITimeoutError,
+    RateLimitError,
+)
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 from src.adapters.base_ai_client import BaseAIClient
 from src.config.config_loader import ConfigLoader
 from src.config.openai_credentials_manager import OpenAICredentialsManager
@@ -22,9 +34,23 @@ class OpenAIClient(BaseAIClient):
             config_loader (ConfigLoader): Configuration loader instance.
             prompt_key (str): Key for the prompt to be loaded.
         """
-        self.model = config_loader.get_config_value("engine")
+        self.model = config_loader.get_config_attr("engine")
         super().__init__(config_loader, prompt_key)
 
+        # Pre-build the per-call-invariant request pieces so the hot path
+        # only allocates the user message dict
+        self._sys_msg = {"role": "system", "content": self.system_message}
+        self._base_kwargs_text = {
+            "model": self.model,
+            "response_format": {"type": "text"},
+            "temperature": 0,
+            "max_tokens": 4000,
+        }
+        self._base_kwargs_json = {
+            **self._base_kwargs_text,
+            "response_format": {"type": "json_object"},
+        }
+
     def get_credentials_manager(self) -> CredentialsManagerInterface:
         """
         Return the OpenAI credentials manager.
@@ -41,33 +67,87 @@ class OpenAIClient(BaseAIClient):
         Returns:
             OpenAI: Initialized OpenAI API client.
         """
-        return OpenAI(api_key=self.api_key)
+        return OpenAI(api_key=self.api_key, http_client=self._get_sync_http_client())
+
+    def initialize_async_client(self):
+        """
+        Initialize the asynchronous OpenAI API client.
+
+        Returns:
+            AsyncOpenAI: Initialized asynchronous OpenAI API client.
+        """
+        return AsyncOpenAI(
+            api_key=self.api_key, http_client=self._get_http_client()
+        )
 
-    def create_completion(self, user_message, is_json=False):
+    def _request_completion(self, user_message, is_json):
         """
-        Create a completion using the OpenAI API.
+        Perform the actual OpenAI API call.
 
         Args:
             user_message (str): User message.
-            is_json (bool, optional): If True, requests response in JSON format.
-                Defaults to False.
+            is_json (bool): If True, requests response in JSON format.
 
         Returns:
             str: OpenAI API response.
         """
         try:
-            return_type = "json_object" if is_json else "text"
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                response_format={"type": return_type},
-                messages=[
-                    {"role": "system", "content": self.system_message},
-                    {"role": "user", "content": user_message},
-                ],
-                temperature=0,
-                max_tokens=4000,
-            )
-            return completion.choices[0].message.content
+            return "".join(self.create_completion_stream(user_message, is_json))
         except Exception as e:
             print(f"\n\nError creating OpenAI completion: {e}")
             return ""
+
+    def create_completion_stream(self, user_message, is_json=False):
+        """
+        Stream a completion from the OpenAI API as it is generated.
+
+        Yields the response text incrementally, so downstream processing
+        can overlap with generation instead of blocking on the full
+        completion.
+
+        Args:
+            user_message (str): User message.
+            is_json (bool, optional): If True, requests response in JSON format.
+                Defaults to False.
+
+        Yields:
+            str: Chunks of the OpenAI API response.
+        """
+        stream = self.client.chat.completions.create(
+            messages=[self._sys_msg, {"role": "user", "content": user_message}],
+            stream=True,
+            **(self._base_kwargs_json if is_json else self._base_kwargs_text),
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential_jitter(1, 30),
+        retry=retry_if_exception_type(
+            (RateLimitError, APITimeoutError, APIConnectionError)
+        ),
+    )
+    async def _acreate(self, user_message, is_json=False):
+        """
+        Create a completion using the asynchronous OpenAI API client.
+
+        Transient failures (rate limits, timeouts, network errors) are
+        retried with exponential backoff, and the call is rate limited to
+        respect the configured requests-per-minute ceiling.
+
+        Args:
+            user_message (str): User message.
+            is_json (bool, optional): If True, requests response in JSON format.
+                Defaults to False.
+
+        Returns:
+            str: OpenAI API response.
+        """
+        async with self._limiter:
+            completion = await self.async_client.chat.completions.create(
+                messages=[self._sys_msg, {"role": "user", "content": user_message}],
+                **(self._base_kwargs_json if is_json else self._base_kwargs_text),
+            )
+        return completion.choices[0].message.content
@@ -0,0 +1,106 @@
+# src/adapters/response_cache.py
+import sqlite3
+import threading
+import time
+
+
+class ResponseCache:
+    """
+    Content-addressable on-disk cache for AI completion responses.
+
+    Stores responses in a SQLite database keyed by a hash of the request
+    content, so repeated pipeline runs reuse earlier completions instead
+    of paying API latency and token costs again.
+    """
+
+    def __init__(self, path=".llm_cache.db", ttl_seconds=None):
+        """
+        Initialize the response cache.
+
+        Args:
+            path (str): Path to the SQLite database file.
+            ttl_seconds (int, optional): Maximum age of cached entries in
+                seconds. If None, entries never expire.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        # Serializes access to the shared connection when completions run
+        # on a thread pool
+        self._lock = threading.Lock()
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS resp (key BLOB PRIMARY KEY, val TEXT, ts INTEGER)"
+        )
+        self.connection.commit()
+
+    def get(self, key):
+        """
+        Look up a cached response.
+
+        Args:
+            key (bytes): Cache key for the request.
+
+        Returns:
+            str or None: The cached response, or None on a miss or when the
+                entry has expired.
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT val, ts FROM resp WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        value, timestamp = row
+        if self.ttl_seconds is not None and time.time() - timestamp > self.ttl_seconds:
+            return None
+
+        return value
+
+    def set(self, key, value):
+        """
+        Store a response in the cache.
+
+        Args:
+            key (bytes): Cache key for the request.
+            value (str): Response to store.
+        """
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO resp (key, val, ts) VALUES (?, ?, ?)",
+                (key, value, int(time.time())),
+            )
+            self.connection.commit()
+
+    def delete(self, key):
+        """
+        Remove a cached response, if present.
+
+        Args:
+            key (bytes): Cache key for the request.
+        """
+        with self._lock:
+            self.connection.execute("DELETE FROM resp WHERE key = ?", (key,))
+            self.connection.commit()
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached response for key, computing and storing it on a miss.
+
+        Empty responses (returned by the clients on API errors) are not
+        cached, so failed calls are retried on the next run.
+
+        Args:
+            key (bytes): Cache key for the request.
+            compute (callable): Zero-argument callable producing the response.
+
+        Returns:
+            str: The cached or freshly computed response.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        value = compute()
+        if value:
+            self.set(key, value)
+        return value
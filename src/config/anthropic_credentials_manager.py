@@ -2,21 +2,28 @@ from src.config.credentials_manager_interface import CredentialsManagerInterface
 import os
 from dotenv import load_dotenv
 
+# Load environment variables from .env file once at import time, instead of
+# re-parsing the file for every client construction
+load_dotenv()
+
 
 class AnthropicCredentialsManager(CredentialsManagerInterface):
     """
     Class to manage Anthropic credentials from environment variables.
     """
 
-    def __init__(self):
-        # Load environment variables from .env file
-        load_dotenv()
+    # API key cached at class level, shared by all instances
+    _cached = None
 
     def get_credentials(self):
         """
-        Get Anthropic credentials from environment variables.
+        Get the Anthropic API key from environment variables.
 
         Returns:
-            dict: Dictionary containing the API key.
+            str: The API key, or an empty string if not set.
         """
-        return {"api_key": os.environ.get("ANTHROPIC_API_KEY")}
+        if AnthropicCredentialsManager._cached is None:
+            AnthropicCredentialsManager._cached = os.environ.get(
+                "ANTHROPIC_API_KEY", ""
+            )
+        return AnthropicCredentialsManager._cached
@@ -10,7 +10,8 @@ class CredentialsManagerInterface(ABC):
     Methods
     -------
     get_credentials()
-        Abstract method to retrieve credentials. Must be implemented by subclasses.
+        Abstract method to retrieve the API key as a string. Must be
+        implemented by subclasses.
     """
     @abstractmethod
     def get_credentials(self):
@@ -2,21 +2,26 @@ from src.config.credentials_manager_interface import CredentialsManagerInterface
 import os
 from dotenv import load_dotenv
 
+# Load environment variables from .env file once at import time, instead of
+# re-parsing the file for every client construction
+load_dotenv()
+
 
 class OpenAICredentialsManager(CredentialsManagerInterface):
     """
     Class to manage OpenAI credentials from environment variables.
     """
 
-    def __init__(self):
-        # Load environment variables from .env file
-        load_dotenv()
+    # API key cached at class level, shared by all instances
+    _cached = None
 
     def get_credentials(self):
         """
-        Get OpenAI credentials from environment variables.
+        Get the OpenAI API key from environment variables.
 
         Returns:
-            dict: Dictionary containing the API key.
+            str: The API key, or an empty string if not set.
         """
-        return {"api_key": os.environ.get("OPENAI_API_KEY")}
+        if OpenAICredentialsManager._cached is None:
+            OpenAICredentialsManager._cached = os.environ.get("OPENAI_API_KEY", "")
+        return OpenAICredentialsManager._cached
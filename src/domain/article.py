@@ -11,6 +11,27 @@ class Article(BaseModel):
     its identification, content, authors, and references.
     """
 
+    # Declared fields live in slots; "__dict__" stays as an overflow for
+    # the **kwargs passthrough (e.g. seq, firstPages from the pipeline)
+    __slots__ = (
+        "id_jems",
+        "title_orig",
+        "title_en",
+        "abstract_orig",
+        "abstract_en",
+        "keywords_orig",
+        "keywords_en",
+        "language",
+        "section_abbrev",
+        "first_page",
+        "pages",
+        "doi",
+        "num_pages",
+        "authors",
+        "references",
+        "__dict__",
+    )
+
     # Define the mapping from dictionary keys to object attributes
     field_mapping = {
         "id_jems": "id_jems",
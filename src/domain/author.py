@@ -1,8 +1,9 @@
 # src/domain/author.py
 from typing import Dict, Any, Optional
-from src.domain.base_model import BaseModel
+from src.domain.base_model import BaseModel, register
 
 
+@register("Author")
 class Author(BaseModel):
     """
     Represents an author of an academic article.
@@ -11,6 +12,21 @@ class Author(BaseModel):
     including personal information and institutional affiliation.
     """
 
+    # Declared fields live in slots; "__dict__" stays as an overflow for
+    # the **kwargs passthrough (e.g. article_id set by the corrector)
+    __slots__ = (
+        "first_name",
+        "middle_name",
+        "last_name",
+        "affiliation",
+        "affiliation_en",
+        "country",
+        "email",
+        "orcid",
+        "order",
+        "__dict__",
+    )
+
     # Define the mapping from dictionary keys to object attributes
     field_mapping = {
         "authorFirstName": "first_name",
@@ -1,6 +1,29 @@
 # src/domain/base_model.py
 from typing import Dict, Any, ClassVar, Type, List, Optional
 
+# Registry of related domain classes, populated by the register decorator.
+# Lets _initialize_related_objects resolve classes without importing and
+# rebuilding a class map on every call.
+_REGISTRY: Dict[str, Type] = {}
+
+
+def register(class_name: str):
+    """
+    Class decorator registering a domain class under class_name.
+
+    Args:
+        class_name (str): Name used to look the class up in the registry.
+
+    Returns:
+        callable: Decorator that registers and returns the class.
+    """
+
+    def decorator(cls):
+        _REGISTRY[class_name] = cls
+        return cls
+
+    return decorator
+
 
 class BaseModel:
     """
@@ -10,12 +33,52 @@ class BaseModel:
     and domain objects.
     """
 
+    # Subclasses declare their fields in __slots__ to avoid a full
+    # per-instance __dict__; models are created in bulk (one Article per
+    # paper, many Author/Reference each), so this cuts memory per instance
+    # and makes attribute access a fixed-offset lookup
+    __slots__ = ()
+
     # Field mappings from dict keys to constructor args - to be defined by subclasses
     field_mapping: ClassVar[Dict[str, str]] = {}
 
     # Reverse field mapping for to_dict conversion - to be defined by subclasses
     reverse_field_mapping: ClassVar[Dict[str, str]] = {}
 
+    def attribute_names(self) -> List[str]:
+        """
+        List the names of all data attributes on this instance.
+
+        Covers the fields declared in __slots__ along the class hierarchy
+        plus any extra attributes that spilled into the per-instance
+        __dict__ (from **kwargs passthrough). Internal names are excluded.
+
+        Returns:
+            list: Attribute names.
+        """
+        names = []
+        for klass in type(self).__mro__:
+            for attr in getattr(klass, "__slots__", ()):
+                if not attr.startswith("_"):
+                    names.append(attr)
+        for attr in self.__dict__:
+            if not attr.startswith("_"):
+                names.append(attr)
+        return names
+
+    @classmethod
+    def _init_lookup(cls):
+        """
+        Memoize the field-remapping structures derived from field_mapping.
+
+        Caches a tuple of (dict_key, attr_name) pairs and a frozenset of
+        the mapped keys on the class, so from_dict doesn't re-iterate the
+        class-level dict for every instance created.
+        """
+        if "_mapping_items" not in cls.__dict__:
+            cls._mapping_items = tuple(cls.field_mapping.items())
+            cls._mapped_keys = frozenset(cls.field_mapping)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BaseModel":
         """
@@ -27,25 +90,48 @@ class BaseModel:
         Returns:
             Object: New instance with data from dictionary
         """
-        # Map dictionary keys to constructor parameter names
-        constructor_args = {}
+        cls._init_lookup()
 
-        # Use the field mapping if defined
-        if cls.field_mapping:
-            for dict_key, attr_name in cls.field_mapping.items():
-                if dict_key in data:
-                    constructor_args[attr_name] = data[dict_key]
+        # Map dictionary keys to constructor parameter names
+        constructor_args = {
+            attr_name: data[dict_key]
+            for dict_key, attr_name in cls._mapping_items
+            if dict_key in data
+        }
 
-        # Include other keys that aren't in the mapping
+        # Include other keys that aren't in the mapping or internal
         for key, value in data.items():
-            # If the key isn't mapped and isn't an internal attribute
-            if (
-                not cls.field_mapping or key not in cls.field_mapping
-            ) and not key.startswith("_"):
+            if key not in cls._mapped_keys and not key.startswith("_"):
                 constructor_args[key] = value
 
         return cls(**constructor_args)
 
+    @classmethod
+    def _output_fields(cls):
+        """
+        Memoize the (attr_name, dict_key) pairs used by to_dict.
+
+        Derives the pairs once per class from the declared __slots__ and
+        the reverse field mapping (falling back to a mapping generated
+        from field_mapping), so serialization doesn't redo the name
+        translation for every instance.
+
+        Returns:
+            tuple: Pairs of (attribute name, output dictionary key).
+        """
+        if "_out_fields" not in cls.__dict__:
+            mapping = cls.reverse_field_mapping
+            if not mapping and cls.field_mapping:
+                mapping = {attr: key for key, attr in cls.field_mapping.items()}
+
+            pairs = []
+            for klass in cls.__mro__:
+                for attr in getattr(klass, "__slots__", ()):
+                    if not attr.startswith("_"):
+                        pairs.append((attr, mapping.get(attr, attr)))
+            cls._out_fields = tuple(pairs)
+        return cls._out_fields
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the object to a dictionary.
@@ -53,22 +139,15 @@ class BaseModel:
         Returns:
             Dict: Dictionary representation of the object
         """
-        # Create mapping to convert attribute names to dictionary keys
-        # If reverse_field_mapping is defined by subclass, use it
-        # Otherwise, generate a reverse mapping from field_mapping
-        mapping = getattr(self.__class__, "reverse_field_mapping", {})
-        if not mapping and self.__class__.field_mapping:
-            mapping = {attr: key for key, attr in self.__class__.field_mapping.items()}
-
-        # Dictionary to store the result
-        result = {}
+        # Declared fields come from the precomputed accessor pairs
+        result = {
+            dict_key: getattr(self, attr) for attr, dict_key in self._output_fields()
+        }
 
-        # Add all attributes to the result dictionary
+        # Extras that spilled into the per-instance __dict__ keep their names
         for attr, value in self.__dict__.items():
-            if not attr.startswith("_"):  # Skip internal attributes
-                # Use mapped name if available, otherwise use attribute name
-                dict_key = mapping.get(attr, attr)
-                result[dict_key] = value
+            if not attr.startswith("_"):
+                result[attr] = value
 
         return result
 
@@ -88,21 +167,18 @@ class BaseModel:
         if not data_list:
             return []
 
-        # Dynamically import classes - note this is done here to avoid circular imports
-        from src.domain.author import Author
-        from src.domain.reference import Reference
-
-        class_map = {"Author": Author, "Reference": Reference}
-
-        cls = class_map.get(class_name)
-        if not cls:
-            return []
-
-        result = []
-        for item in data_list:
-            if isinstance(item, dict):
-                result.append(cls.from_dict(item))
-            elif isinstance(item, cls):
-                result.append(item)
-
-        return result
+        cls = _REGISTRY.get(class_name)
+        if cls is None:
+            # Make sure the domain modules have been imported so their
+            # classes register themselves, then retry the lookup
+            from src.domain import author, reference  # noqa: F401
+
+            cls = _REGISTRY.get(class_name)
+            if cls is None:
+                return []
+
+        return [
+            cls.from_dict(item) if isinstance(item, dict) else item
+            for item in data_list
+            if isinstance(item, (dict, cls))
+        ]
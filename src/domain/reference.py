@@ -1,8 +1,9 @@
 # src/domain/reference.py
 from typing import Dict, Any, Optional
-from src.domain.base_model import BaseModel
+from src.domain.base_model import BaseModel, register
 
 
+@register("Reference")
 class Reference(BaseModel):
     """
     Represents a bibliographic reference in an academic article.
@@ -11,6 +12,17 @@ class Reference(BaseModel):
     including its description, identifiers, and links.
     """
 
+    # Declared fields live in slots; "__dict__" stays as an overflow for
+    # the **kwargs passthrough
+    __slots__ = (
+        "description",
+        "doi",
+        "link",
+        "accessed",
+        "order",
+        "__dict__",
+    )
+
     # Define the mapping from dictionary keys to object attributes
     field_mapping = {
         "description": "description",
@@ -1,11 +1,61 @@
 # src/io/csv_writer.py
 import csv
-import json
+import orjson
 import os
+from contextlib import ExitStack
 from src.domain.article import Article
 from typing import List, Union, Dict, Any, Callable
 
 
+class _FastRowWriter:
+    """
+    csv.writer wrapper with a fast path for rows that need no quoting.
+
+    Rows whose fields contain no delimiter, quote or newline are joined
+    and written directly, skipping the csv module's per-field escaping
+    scan; anything else falls back to the real csv.writer.
+    """
+
+    _SPECIALS = (";", '"', "\n", "\r")
+
+    def __init__(self, csvfile, delimiter=";"):
+        self._file = csvfile
+        self._writer = csv.writer(csvfile, delimiter=delimiter)
+
+    def writerow(self, row):
+        fields = [
+            value if isinstance(value, str) else str(value) for value in row
+        ]
+        for field in fields:
+            if any(special in field for special in self._SPECIALS):
+                self._writer.writerow(row)
+                return
+        # csv.writer's default line terminator, kept for identical output
+        self._file.write(";".join(fields) + "\r\n")
+
+    def writerows(self, rows):
+        # Fast-path rows are accumulated and flushed in one write; rows
+        # that need escaping interleave through the real csv.writer in order
+        pending = []
+        for row in rows:
+            fields = [
+                value if isinstance(value, str) else str(value) for value in row
+            ]
+            if any(
+                special in field
+                for field in fields
+                for special in self._SPECIALS
+            ):
+                if pending:
+                    self._file.write("".join(pending))
+                    pending.clear()
+                self._writer.writerow(row)
+            else:
+                pending.append(";".join(fields) + "\r\n")
+        if pending:
+            self._file.write("".join(pending))
+
+
 class CsvWriter:
     """
     Responsible for writing articles data to CSV files.
@@ -45,6 +95,17 @@ class CsvWriter:
             self.load_headers(config_path)
         )
 
+        # Column-position lookups derived lazily from the header lists
+        self._header_indexes = {}
+
+        # Per-write memo of to_dict() results keyed by object id, so an
+        # object serialized for one file isn't re-serialized for another
+        self._dict_cache = {}
+
+        # Accessor bound per batch when all articles share one shape;
+        # None means dispatch per item
+        self._items_getter = None
+
     def load_headers(self, config_path):
         """
         Load CSV headers from a configuration file.
@@ -55,8 +116,8 @@ class CsvWriter:
         Returns:
             tuple: Headers for articles, authors, and references
         """
-        with open(config_path, "r") as json_file:
-            headers_dict = json.load(json_file)
+        with open(config_path, "rb") as json_file:
+            headers_dict = orjson.loads(json_file.read())
         return (
             headers_dict["headers_artigos"],
             headers_dict["headers_autores"],
@@ -74,12 +135,76 @@ class CsvWriter:
             process_function (callable): Function to process each data item
         """
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers, delimiter=";")
-            writer.writeheader()
+        with open(
+            path, "w", newline="", encoding="utf-8", buffering=1 << 20
+        ) as csvfile:
+            writer = _FastRowWriter(csvfile, delimiter=";")
+            writer.writerow(headers)
             for seq, data in enumerate(data_list, start=1):
                 process_function(writer, seq, data)
 
+    def _header_index(self, headers):
+        """
+        Get the column-position lookup for a header list, building it once.
+
+        Args:
+            headers (list): CSV column headers
+
+        Returns:
+            dict: Mapping from header name to column index
+        """
+        index = self._header_indexes.get(id(headers))
+        if index is None:
+            index = {header: i for i, header in enumerate(headers)}
+            self._header_indexes[id(headers)] = index
+        return index
+
+    def _row_from_article(self, article, headers, extra_data=None):
+        """
+        Build a CSV row straight from an Article's attributes.
+
+        Skips to_dict() entirely, so the nested author and reference
+        lists are never serialized just to be discarded by the header
+        filter.
+
+        Args:
+            article (Article): Article object
+            headers (list): Fields to include in the result
+            extra_data (dict, optional): Additional data to include
+
+        Returns:
+            list: Row values ordered by headers
+        """
+        header_index = self._header_index(headers)
+        row = [""] * len(headers)
+
+        for attr, dict_key in type(article)._output_fields():
+            position = header_index.get(dict_key)
+            if position is not None:
+                value = getattr(article, attr)
+                if value is not None:
+                    row[position] = value
+
+        # Extras that spilled into the per-instance __dict__ keep their names
+        for key, value in article.__dict__.items():
+            if not key.startswith("_"):
+                position = header_index.get(key)
+                if position is not None and value is not None:
+                    row[position] = value
+
+        # Backward-compatible alias kept by Article.to_dict
+        position = header_index.get("idJEMS")
+        if position is not None and article.id_jems is not None:
+            row[position] = article.id_jems
+
+        if extra_data:
+            for key, value in extra_data.items():
+                position = header_index.get(key)
+                if position is not None:
+                    row[position] = value
+
+        return row
+
     def process_data(self, object_or_dict, headers, extra_data=None):
         """
         Generic method to process data objects or dictionaries.
@@ -90,28 +215,45 @@ class CsvWriter:
             extra_data (dict, optional): Additional data to include
 
         Returns:
-            dict: Dictionary with fields from headers
+            list: Row values ordered by headers, or an empty list on error
         """
         try:
-            # Get the data as a dictionary
+            # Articles bypass the dict materialization entirely
+            if isinstance(object_or_dict, Article):
+                return self._row_from_article(object_or_dict, headers, extra_data)
+
+            # Get the data as a dictionary, memoizing object serializations
             if hasattr(object_or_dict, "to_dict"):
-                data = object_or_dict.to_dict()
+                data = self._dict_cache.get(id(object_or_dict))
+                if data is None:
+                    data = object_or_dict.to_dict()
+                    self._dict_cache[id(object_or_dict)] = data
             else:
-                data = {key: object_or_dict.get(key, "") for key in headers}
+                data = object_or_dict
+
+            # Build the positional row, placing each known field by index
+            header_index = self._header_index(headers)
+            row = [""] * len(headers)
+            for key, value in data.items():
+                position = header_index.get(key)
+                if position is not None and value is not None:
+                    row[position] = value
 
             # Add extra data if provided
             if extra_data:
-                data.update(extra_data)
+                for key, value in extra_data.items():
+                    position = header_index.get(key)
+                    if position is not None:
+                        row[position] = value
 
-            # Filter to include only fields in headers
-            return {key: data.get(key, "") for key in headers}
+            return row
 
         except AttributeError as e:
             print(f"Erro ao processar dados: {e}")
             print(f"Tipo do objeto: {type(object_or_dict)}")
             if isinstance(object_or_dict, str):
                 print(f"Erro: objeto é uma string: *{object_or_dict}*")
-            return {}
+            return []
 
     def _get_items_from_article(self, article, attribute_name):
         """
@@ -124,11 +266,20 @@ class CsvWriter:
         Returns:
             list: Items from the article
         """
-        return (
-            getattr(article, attribute_name)
-            if hasattr(article, attribute_name)
-            else article.get(attribute_name, [])
+        getter = self._items_getter or (
+            self._dict_items_getter
+            if isinstance(article, dict)
+            else self._attr_items_getter
         )
+        return getter(article, attribute_name)
+
+    @staticmethod
+    def _attr_items_getter(article, attribute_name):
+        return getattr(article, attribute_name, [])
+
+    @staticmethod
+    def _dict_items_getter(article, attribute_name):
+        return article.get(attribute_name, [])
 
     def process_items_data(
         self, writer, seq, article, attribute_name, headers, additional_fields=None
@@ -137,7 +288,7 @@ class CsvWriter:
         Process items (authors or references) data for CSV writing.
 
         Args:
-            writer (csv.DictWriter): CSV writer object
+            writer (csv.writer): CSV writer object
             seq (int): Sequence number
             article: Article object or dictionary
             attribute_name (str): Name of the attribute to process ('authors' or 'references')
@@ -146,6 +297,8 @@ class CsvWriter:
         """
         items = self._get_items_from_article(article, attribute_name)
 
+        # Collect the article's rows first so they go out in one batch
+        rows = []
         for i, item in enumerate(items, start=1):
             item_data = {"article": seq, "order": i}
             if additional_fields:
@@ -153,14 +306,17 @@ class CsvWriter:
 
             row_data = self.process_data(item, headers, item_data)
             if row_data:
-                writer.writerow(row_data)
+                rows.append(row_data)
+
+        if rows:
+            writer.writerows(rows)
 
     def process_artigos_data(self, writer, seq, article):
         """
         Process article data for CSV writing.
 
         Args:
-            writer (csv.DictWriter): CSV writer object
+            writer (csv.writer): CSV writer object
             seq (int): Sequence number
             article (Article): Article object or dictionary
         """
@@ -173,7 +329,7 @@ class CsvWriter:
         Process authors data for CSV writing.
 
         Args:
-            writer (csv.DictWriter): CSV writer object
+            writer (csv.writer): CSV writer object
             seq (int): Sequence number
             article (Article): Article object or dictionary
         """
@@ -184,7 +340,7 @@ class CsvWriter:
         Process references data for CSV writing.
 
         Args:
-            writer (csv.DictWriter): CSV writer object
+            writer (csv.writer): CSV writer object
             seq (int): Sequence number
             article (Article): Article object or dictionary
         """
@@ -196,25 +352,56 @@ class CsvWriter:
         """
         Write objects to CSV files.
 
+        All three CSV files are produced in a single pass over the
+        articles, instead of traversing (and re-serializing) the list
+        once per file.
+
         Args:
             articles_data (list): List of Article objects or dictionaries
         """
-        self.write_to_csv(
-            self.path_artigos_csv,
-            self.headers_artigos,
-            articles_data,
-            self.process_artigos_data,
-        )
-        self.write_to_csv(
-            self.path_autores_csv,
-            self.headers_autores,
-            articles_data,
-            self.process_autores_data,
-        )
-        self.write_to_csv(
-            self.path_references_csv,
-            self.headers_references,
-            articles_data,
-            self.process_references_data,
-        )
+        targets = [
+            (self.path_artigos_csv, self.headers_artigos),
+            (self.path_autores_csv, self.headers_autores),
+            (self.path_references_csv, self.headers_references),
+        ]
+
+        # Fresh memo per write; id()-keyed entries are only valid while
+        # the objects they describe are alive
+        self._dict_cache.clear()
+
+        # Bind the item accessor once when the whole batch shares one
+        # shape, instead of probing every article with hasattr
+        if articles_data and all(isinstance(a, Article) for a in articles_data):
+            self._items_getter = self._attr_items_getter
+        elif articles_data and all(isinstance(a, dict) for a in articles_data):
+            self._items_getter = self._dict_items_getter
+
+        with ExitStack() as stack:
+            writers = []
+            for path, headers in targets:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                csvfile = stack.enter_context(
+                    open(
+                        path,
+                        "w",
+                        newline="",
+                        encoding="utf-8",
+                        buffering=1 << 20,
+                    )
+                )
+                writer = _FastRowWriter(csvfile, delimiter=";")
+                writer.writerow(headers)
+                writers.append(writer)
+
+            artigos_writer, autores_writer, references_writer = writers
+
+            for seq, article in enumerate(articles_data, start=1):
+                self.process_artigos_data(artigos_writer, seq, article)
+                self.process_autores_data(autores_writer, seq, article)
+                self.process_references_data(references_writer, seq, article)
+
+        # Release the cached dictionaries (and the objects they reference)
+        self._dict_cache.clear()
+        self._items_getter = None
+
         print(f"CSV files created in {self.save_directory}")
@@ -1,5 +1,5 @@
 # src/logging/json_logger.py
-import json
+import orjson
 import os
 import datetime
 from src.config.config_loader import ConfigLoader
@@ -17,6 +17,9 @@ class JsonLogger:
     _config_loader = None
     _base_dir = None
 
+    # Directories already created this run; avoids a stat syscall per log call
+    _dirs_ensured = set()
+
     @classmethod
     def initialize(cls, config_loader: ConfigLoader):
         """
@@ -58,9 +61,10 @@ class JsonLogger:
         # Determine target directory
         target_dir = directory or cls.get_base_dir()
 
-        # Ensure directory exists
-        if not os.path.exists(target_dir):
+        # Ensure directory exists (checked once per directory per run)
+        if target_dir not in cls._dirs_ensured:
             os.makedirs(target_dir, exist_ok=True)
+            cls._dirs_ensured.add(target_dir)
 
         # Add .json extension if not present
         if not file_name.lower().endswith(".json"):
@@ -70,7 +74,7 @@ class JsonLogger:
         return os.path.join(target_dir, file_name)
 
     @classmethod
-    def print_json(cls, file_name, data, directory=None):
+    def print_json(cls, file_name, data, directory=None, append=False):
         """
         Saves data in JSON format to a file.
 
@@ -78,6 +82,9 @@ class JsonLogger:
             file_name (str): File name (without extension).
             data (dict/list): Data to be saved as JSON.
             directory (str, optional): Directory to save the file. If None, uses the default directory.
+            append (bool, optional): If True, appends the data as one NDJSON
+                line instead of rewriting the whole file. Useful for logging
+                one record per article without O(n²) rewrite cost.
 
         Returns:
             str: Complete path of the saved file.
@@ -85,6 +92,14 @@ class JsonLogger:
         # Prepare file path
         file_path = cls._prepare_path(file_name, directory)
 
+        if append:
+            # One JSON document per line; no timestamp wrapping
+            with open(file_path, "ab") as f:
+                f.write(
+                    orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+                )
+            return file_path
+
         # Add timestamp if not an existing file update
         data_to_save = data
         if isinstance(data, dict) and not os.path.exists(file_path):
@@ -94,9 +109,14 @@ class JsonLogger:
                 "data": data,
             }
 
-        # Save data in JSON format
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data_to_save, f, ensure_ascii=False, indent=2)
+        # Save data in JSON format (orjson serializes straight to UTF-8 bytes)
+        with open(file_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data_to_save,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
 
         return file_path
 
@@ -116,7 +136,26 @@ class JsonLogger:
         file_path = cls._prepare_path(file_name, directory)
 
         # Read data from JSON file
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
 
         return data
+
+    @classmethod
+    def read_ndjson(cls, file_name, directory=None):
+        """
+        Reads records from an NDJSON file written with print_json(append=True).
+
+        Args:
+            file_name (str): File name (without extension).
+            directory (str, optional): File directory. If None, uses the default directory.
+
+        Yields:
+            dict/list: One record per line, lazily.
+        """
+        file_path = cls._prepare_path(file_name, directory)
+
+        with open(file_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
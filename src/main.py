@@ -9,6 +9,8 @@ from src.logging.json_logger import JsonLogger
 from src.services.authors_affiliation_corrector import AuthorsAffiliationCorrector
 from src.utils.text_processor import TextProcessor
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from typing import Dict
 
@@ -23,16 +25,20 @@ def create_ai_clients(config_loader: ConfigLoader, use_openai: bool) -> Dict[str
     client_types = {
         "article_ai_client": "article_extraction",
         "references_ai_client": "references_extraction",
+        "combined_ai_client": "combined_extraction",
         "field_completion_ai_client": "field_completion",
         "affiliation_correction_client": "author_affiliation_correction",
         "text_processing_client": "text_processing"
     }
     
-    # Criar clientes para diferentes propósitos com diferentes prompts
-    return {
-        client_key: client_class(config_loader, prompt_key)
-        for client_key, prompt_key in client_types.items()
-    }
+    # Criar clientes para diferentes propósitos com diferentes prompts;
+    # as construções são independentes, então rodam em paralelo
+    with ThreadPoolExecutor(max_workers=len(client_types)) as executor:
+        clients = executor.map(
+            lambda prompt_key: client_class(config_loader, prompt_key),
+            client_types.values(),
+        )
+        return dict(zip(client_types, clients))
 
 
 def main():
@@ -64,6 +70,7 @@ def main():
         ai_clients["references_ai_client"],
         ai_clients["field_completion_ai_client"],
         text_processor,
+        combined_ai_client=ai_clients["combined_ai_client"],
     )
 
     migrator = Migrator(config_loader, article_extractor)
@@ -85,6 +92,7 @@ def main():
 
 
 if __name__ == "__main__":
-    # Clear the terminal screen
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # Clear the terminal screen (skipped when output is piped or in CI)
+    if sys.stdout.isatty():
+        os.system('cls' if os.name == 'nt' else 'clear')
     main()
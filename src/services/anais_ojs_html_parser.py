@@ -1,20 +1,39 @@
+import requests
 from bs4 import BeautifulSoup
-from src.services.pdf_downloader import PDFDownloader
+from concurrent.futures import ThreadPoolExecutor
+import lxml.html
+from lxml import etree
 from src.config.config_loader import ConfigLoader
 import json
 from urllib.parse import urlparse, unquote
 
 
 class OJSHTMLParser:
+    # XPath expressions compiled once at class load; evaluation runs in C
+    # instead of Python-level tree walks
+    _SECTIONS_XP = etree.XPath("//h4[contains(@class, 'tocSectionTitle')]")
+    _TITLE_XP = etree.XPath("string(.//div[@class='tocTitle'])")
+    _PAGES_XP = etree.XPath("string(.//div[@class='tocPages'])")
+    _PDF_XP = etree.XPath(".//a[normalize-space(.)='PDF']/@href")
+
     def __init__(self, site_url):
         self.site_url = site_url
+        # One session for all HTML fetches: the kept-alive connection is
+        # reused instead of paying a TCP/TLS handshake per page
+        self._session = requests.Session()
+
+    def _download_html(self, site_url):
+        response = self._session.get(site_url, timeout=30)
+        response.raise_for_status()
+        return response.content
 
     def download_html_and_create_parser(self, site_url):
-        downloader = PDFDownloader(site_url, 'output')
-        html_file = downloader.download_file(site_url)
-        soup = BeautifulSoup(html_file, 'html.parser')
+        soup = BeautifulSoup(self._download_html(site_url), 'lxml')
         return soup
 
+    def download_html_and_create_tree(self, site_url):
+        return lxml.html.fromstring(self._download_html(site_url))
+
 
     def extract_articles_info_from_the_website(self, num_files_to_process=-1):
         """
@@ -34,35 +53,41 @@ class OJSHTMLParser:
         # Data structure to store extracted information
         data = []
 
+        # Per-article entries collected before any metadata page is fetched
+        entries = []
+
         # Sequential number for articles
         seq_num = 1
 
-        soup = self.download_html_and_create_parser(self.site_url)
+        tree = self.download_html_and_create_tree(self.site_url)
 
         # Identify and process each section
-        sections = soup.find_all("h4", class_="tocSectionTitle")
+        sections = self._SECTIONS_XP(tree)
         for section in sections:
-            section_name = section.text.strip()
+            section_name = section.text_content().strip()
             section_abbrev = (
                 "EDT"
                 if "Editorial" in section_name
                 else "ART-C" if "Artigos Completos" in section_name else "ART-R"
             )
 
-            # Find all articles in this section
-            next_sibling = section.find_next_sibling()
-            while next_sibling and next_sibling.name == "table":
+            # Each article is a table directly following the section header;
+            # the run of tables ends at the next non-table sibling
+            for sibling in section.itersiblings():
+                if sibling.tag != "table":
+                    break
+
                 # Check if we've reached the limit
                 if num_files_to_process != -1 and seq_num > num_files_to_process:
                     break
 
-                article_title = next_sibling.find("div", class_="tocTitle").text.strip()
-                page_start = next_sibling.find("div", class_="tocPages").text.strip()
+                article_title = self._TITLE_XP(sibling).strip()
+                page_start = self._PAGES_XP(sibling).strip()
 
                 # Attempt to find the PDF link
-                pdf_link_element = next_sibling.find("a", href=True, text="PDF")
-                if pdf_link_element:
-                    pdf_url = pdf_link_element["href"]
+                pdf_hrefs = self._PDF_XP(sibling)
+                if pdf_hrefs:
+                    pdf_url = pdf_hrefs[0]
                     metadados_url = self.convert_url(pdf_url)
                     parsed_url = urlparse(pdf_url)
                     pdf_file_name = unquote(
@@ -79,27 +104,33 @@ class OJSHTMLParser:
                     "firstPage": page_start,
                     "idJEMS": pdf_file_name,  # Add the processed PDF file name here
                 }
-                print("Processando arquivo: ", metadados["idJEMS"])
-
-                # Get additional metadata
-                additional_metadata = self.get_metadata(metadados_url)
-                print("Pegou metadados adicionais: do arquivo", metadados["idJEMS"])
-
-                # Add items from additional_metadata to metadados, but only if they don't already exist in metadados
-                for key, value in additional_metadata.items():
-                    if key not in metadados:
-                        metadados[key] = value
-                    else:
-                        metadados[key + str(2)] = value
-                data.append(metadados)
+                entries.append((metadados, metadados_url))
 
                 seq_num += 1
-                next_sibling = next_sibling.find_next_sibling()
 
             # Check if we've reached the limit (outside the inner loop)
             if num_files_to_process != -1 and seq_num > num_files_to_process:
                 break
 
+        # The entries hold plain strings only, so the TOC tree can be
+        # freed before the (long) metadata-fetch phase
+        del sections, tree
+
+        # Fetch the per-article metadata pages concurrently; each fetch is
+        # dominated by network latency, so a thread pool overlaps them
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            additional_metadatas = list(
+                executor.map(self.get_metadata, [url for _, url in entries])
+            )
+
+        for (metadados, _), additional_metadata in zip(entries, additional_metadatas):
+            print("Processando arquivo: ", metadados["idJEMS"])
+            print("Pegou metadados adicionais: do arquivo", metadados["idJEMS"])
+
+            # Single C-level merge; values from the TOC win on duplicate
+            # keys, as before (nothing downstream read the old "key2" copies)
+            data.append({**additional_metadata, **metadados})
+
         return data
 
     # Convert a URL to a new URL to get the URL for metadata, according to the exemple bellow
@@ -109,6 +140,13 @@ class OJSHTMLParser:
         # Replace "article/view" with "rt/metadata" in the URL
         return url.replace("article/view", "rt/metadata")
 
+    # Label cells in the OJS metadata table mapped to the slots their
+    # sibling cells fill; matched by containment, like the old scans
+    _LABEL_MAP = {
+        'Título do documento': 'article',
+        'Digital Object Identifier (DOI)': 'doi',
+    }
+
     def get_metadata(self, metadados_url):
         metadata = {
             'article': '',
@@ -120,60 +158,63 @@ class OJSHTMLParser:
 
         soup = self.download_html_and_create_parser(metadados_url)
 
-        # Encontrar o título
-        title_tag = soup.find('td', string=lambda x: x and 'Título do documento' in x)
-        if title_tag:
-            title_td = title_tag.find_next_sibling('td')
-            if title_td:
-                metadata['article'] = title_td.text.strip()
-
-        # Encontrar o DOI
-        title_tag = soup.find('td', string=lambda x: x and 'Digital Object Identifier (DOI)' in x)
-        if title_tag:
-            title_td = title_tag.find_next_sibling('td')
-            if title_td:
-                metadata['doi'] = title_td.text.strip()
-
-        author_tags = soup.find_all('td', string=lambda x: x and 'Autor' in x)
-        for tag in author_tags:
-            # Navegar para a célula correta que contém os dados do autor
-            # Se a estrutura sempre incluir uma célula de descrição antes dos dados, ajuste conforme necessário
-            info_td = tag.find_next('td')  # primeiro td após o título 'Autor'
-            if info_td:
-                next_td = info_td.find_next_sibling('td')
-                if next_td:
-                    author_details = next_td.text.split(';')
-                    if len(author_details) >= 3:
-                        author = {
-                            'name': author_details[0].strip(),
-                            'authorAffiliation': author_details[1].strip(),
-                            'authorCountry': author_details[2].strip()
-                        }
-                        metadata['authors'].append(author)
-
-        # Encontrar Resumo e Abstract
-        description_tag = soup.find('td', string=lambda x: x and ('Resumo' in x or 'Abstract' in x))
-        if description_tag:
-            next_td = description_tag.find_next_sibling('td')
-            if next_td:
-                content = next_td.text
-                # Processar Resumo e Abstract
-                if "Resumo:" in content and "Abstract:" in content:
-                    # Separar Resumo e Abstract se ambos estiverem presentes
-                    resumo_text = content.split("Abstract:")[0].replace("Resumo:", "").strip()
-                    abstract_text = content.split("Abstract:")[1].strip()
-                    metadata['abstractOrig'] = resumo_text
-                    metadata['abstractEn'] = abstract_text
-                elif "Resumo:" in content:
-                    # Apenas Resumo presente
-                    resumo_text = content.replace("Resumo:", "").strip()
-                    metadata['abstractOrig'] = resumo_text
-                elif "Abstract:" in content:
-                    # Apenas Abstract presente
-                    abstract_text = content.replace("Abstract:", "").strip()
-                    metadata['abstractEn'] = abstract_text
+        # Uma única passagem pelas células da tabela substitui uma
+        # varredura completa da árvore por campo procurado
+        description_seen = False
+        for td in soup.find_all('td'):
+            label = td.string
+            if not label:
+                continue
+
+            for label_text, key in self._LABEL_MAP.items():
+                if label_text in label:
+                    if not metadata[key]:
+                        next_td = td.find_next_sibling('td')
+                        if next_td:
+                            metadata[key] = next_td.text.strip()
+                    break
+            else:
+                if 'Autor' in label:
+                    # Navegar para a célula correta que contém os dados do autor
+                    # Se a estrutura sempre incluir uma célula de descrição antes dos dados, ajuste conforme necessário
+                    info_td = td.find_next('td')  # primeiro td após o título 'Autor'
+                    if info_td:
+                        next_td = info_td.find_next_sibling('td')
+                        if next_td:
+                            author_details = next_td.text.split(';')
+                            if len(author_details) >= 3:
+                                author = {
+                                    'name': author_details[0].strip(),
+                                    'authorAffiliation': author_details[1].strip(),
+                                    'authorCountry': author_details[2].strip()
+                                }
+                                metadata['authors'].append(author)
+                elif not description_seen and ('Resumo' in label or 'Abstract' in label):
+                    # Encontrar Resumo e Abstract
+                    description_seen = True
+                    next_td = td.find_next_sibling('td')
+                    if next_td:
+                        content = next_td.text
+                        # Processar Resumo e Abstract: partition localiza
+                        # o separador em uma única varredura da string
+                        before, sep, after = content.partition("Abstract:")
+                        if sep and "Resumo:" in before:
+                            # Separar Resumo e Abstract se ambos estiverem presentes
+                            metadata['abstractOrig'] = before.replace("Resumo:", "").strip()
+                            metadata['abstractEn'] = after.strip()
+                        elif "Resumo:" in content:
+                            # Apenas Resumo presente
+                            metadata['abstractOrig'] = content.replace("Resumo:", "").strip()
+                        elif sep:
+                            # Apenas Abstract presente
+                            metadata['abstractEn'] = (before + after).strip()
+        # All extracted values are plain strings, so the parse tree can be
+        # torn down now; decompose breaks BS4's internal back-references
+        # that would otherwise keep the whole tree resident
+        soup.decompose()
+
         article = self._get_article_and_authors(metadata)
-        return article   
+        return article
 
     def _get_article_and_authors(self, metadata):
         article = {
@@ -190,11 +231,15 @@ class OJSHTMLParser:
 
         authors = []
         for i, author_metadata in enumerate(metadata.get("authors", [])):
-            name_parts = author_metadata.get("name", "").split()
+            # partition/rpartition peel first and last names off directly,
+            # without building a list plus a middle-name sub-list per author
+            name = author_metadata.get("name", "").strip()
+            first_name, _, rest = name.partition(" ")
+            middle_name, _, last_name = rest.rpartition(" ")
             author = {
-            "authorFirstName": name_parts[0] if name_parts else "",
-            "authorMiddleName": " ".join(name_parts[1:-1]) if len(name_parts) > 2 else "",
-            "authorLastName": name_parts[-1] if len(name_parts) > 1 else "",
+            "authorFirstName": first_name,
+            "authorMiddleName": middle_name,
+            "authorLastName": last_name,
             "authorAffiliation": author_metadata.get("authorAffiliation", ""),
             "authorAffiliationEn": "",
             "authorCountry": author_metadata.get("authorCountry", ""),
@@ -1,5 +1,6 @@
-import json
+import orjson
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Union, Tuple
 from src.config.config_loader import ConfigLoader
 from src.utils.text_processor import TextProcessor
@@ -8,6 +9,18 @@ from src.domain.author import Author
 from src.domain.reference import Reference
 from src.adapters.ai_client_interface import AIClientInterface
 
+# Patterns compiled once at import; used on every article, so this skips
+# the re-cache lookup per call and the lowercased page copies the old
+# substring scans required
+_JSON_RE = re.compile(r"\{.*\}|\[.*\]", re.DOTALL)
+_INTRO_RE = re.compile(r"introdu[cç][aã]o|introduction", re.IGNORECASE)
+
+# Fields exempt from the empty-field check (built once, O(1) lookups)
+_COMPLETION_SKIP_KEYS = frozenset(("firstPages", "lastPages", "references"))
+_REF_RE = re.compile(
+    r"references|refer[êeˆ]+ncias?|bibliography|bibliografia", re.IGNORECASE
+)
+
 
 class ArticleExtractor:
     """Extracts metadata from articles based on text content.
@@ -22,6 +35,7 @@ class ArticleExtractor:
         references_ai_client: AIClientInterface,
         field_completion_ai_client: AIClientInterface,
         text_processor: TextProcessor = None,
+        combined_ai_client: AIClientInterface = None,
     ):
         """Initializes the article extractor.
 
@@ -31,10 +45,14 @@ class ArticleExtractor:
             field_completion_ai_client (AIClientInterface): AI client for completing missing fields.
             text_processor (TextProcessor, optional): Text processor for cleaning text.
                 If not provided, a new one will be created.
+            combined_ai_client (AIClientInterface, optional): AI client that extracts
+                metadata and references in a single call. When provided, it replaces
+                the two separate extraction round-trips per article.
         """
         self.article_ai_client = article_ai_client
         self.references_ai_client = references_ai_client
         self.field_completion_ai_client = field_completion_ai_client
+        self.combined_ai_client = combined_ai_client
         self.text_processor = text_processor or TextProcessor()
 
     def extract_articles_data_from_PDF_text(
@@ -48,14 +66,29 @@ class ArticleExtractor:
         Returns:
             list: List of Article objects with article metadata.
         """
-        articles_list = []
+        return list(self.iter_articles(all_files_text))
 
-        for count, one_article_text in enumerate(all_files_text, start=1):
-            article = self.extract_article_data(one_article_text)
-            articles_list.append(article)
-            print(f"\n\nProcessed article number {count}\n")
+    def iter_articles(self, all_files_text: List[Dict]):
+        """Yields Article objects as their extraction completes.
 
-        return articles_list
+        Each article blocks on two or three AI HTTP round-trips, so the
+        work is network-bound: the articles are fanned out on a thread
+        pool (the GIL is released during socket I/O) and yielded in their
+        original order, letting the caller consume them without holding
+        the whole list.
+
+        Args:
+            all_files_text (list): List of dictionaries containing text extracted from PDFs.
+
+        Yields:
+            Article: Article objects with article metadata.
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for count, article in enumerate(
+                executor.map(self.extract_article_data, all_files_text), start=1
+            ):
+                print(f"\n\nProcessed article number {count}\n")
+                yield article
 
     def extract_article_data(self, one_article_text: Dict) -> Article:
         """Extracts data from a single article.
@@ -67,10 +100,13 @@ class ArticleExtractor:
             Article: Article object with article metadata.
         """
         first_pages = self.extract_pages(one_article_text, page_location="first")
-        first_pages = self.text_processor.clean_text(first_pages)
-
         last_pages = self.extract_pages(one_article_text, page_location="last")
-        last_pages = self.text_processor.clean_text(last_pages)
+
+        # Clean both extracts together so any AI encoding corrections
+        # share a single completion call
+        first_pages, last_pages = self.text_processor.clean_texts(
+            (first_pages, last_pages)
+        )
 
         # Check if we have section information
         section_abbrev = one_article_text.get("sectionAbbrev", None)
@@ -103,14 +139,12 @@ class ArticleExtractor:
             # Strategy for initial pages
             first_page = text_pages[0]
 
-            if len(text_pages) < 2 or any(
-                word in first_page.lower()
-                for word in ["introducao", "introdução", "introduction"]
-            ):
+            if len(text_pages) < 2 or _INTRO_RE.search(first_page):
                 return str(first_page)
             else:
-                second_page = text_pages[1]
-                return f"{first_page}, {second_page}"
+                # join preallocates the result buffer once instead of
+                # going through the f-string formatting machinery
+                return ", ".join((first_page, text_pages[1]))
 
         elif page_location == "last":
             # Strategy for final pages
@@ -118,24 +152,12 @@ class ArticleExtractor:
                 return str(text_pages[0])
 
             last_page = text_pages[-1]
-            ref_indicators = [
-                "references",
-                "referências",
-                "referencias",
-                "bibliography",
-                "bibliografia",
-                "referência",
-                "referˆencia",
-            ]
-
-            if len(text_pages) < 2 or any(
-                word in last_page.lower() for word in ref_indicators
-            ):
+
+            if len(text_pages) < 2 or _REF_RE.search(last_page):
                 return str(last_page)
             else:
                 third_last_page = text_pages[-3] if len(text_pages) > 3 else ""
-                second_last_page = text_pages[-2]
-                return f"{third_last_page} {second_last_page} {last_page}"
+                return " ".join((third_last_page, text_pages[-2], last_page))
 
         # Default behavior for invalid argument
         raise ValueError(f"Invalid page location: {page_location}")
@@ -153,7 +175,24 @@ class ArticleExtractor:
         Returns:
             dict: Dictionary with article metadata and references.
         """
-        article_dict = self.extract_article_metadata_with_ai(first_pages)
+        # One fused call extracts metadata and references together when a
+        # combined client is available; editorials keep the single
+        # metadata call since they have no references to extract
+        if self.combined_ai_client is not None and section_abbrev != "EDT":
+            article_dict = self.extract_combined_metadata_with_ai(
+                first_pages, last_pages
+            )
+        else:
+            article_dict = self.extract_article_metadata_with_ai(first_pages)
+
+            # Only extract references if NOT an editorial
+            if section_abbrev != "EDT":
+                references_dict = self.extract_references_metadata_with_ai(last_pages)
+                article_dict["references"] = references_dict.get("references", [])
+            else:
+                # For editorials, just add an empty references list
+                article_dict["references"] = []
+
         article_dict["firstPages"] = first_pages
         article_dict["lastPages"] = last_pages
 
@@ -161,14 +200,6 @@ class ArticleExtractor:
         if section_abbrev:
             article_dict["sectionAbbrev"] = section_abbrev
 
-        # Only extract references if NOT an editorial
-        if section_abbrev != "EDT":
-            references_dict = self.extract_references_metadata_with_ai(last_pages)
-            article_dict["references"] = references_dict.get("references", [])
-        else:
-            # For editorials, just add an empty references list
-            article_dict["references"] = []
-
         return article_dict
 
     def extract_article_metadata_with_ai(self, first_pages: str) -> Dict:
@@ -182,6 +213,30 @@ class ArticleExtractor:
         """
         return self.extract_info_with_ai(self.article_ai_client, first_pages)
 
+    def extract_combined_metadata_with_ai(
+        self, first_pages: str, last_pages: str
+    ) -> Dict:
+        """Extracts metadata and references in a single AI call.
+
+        Fuses the metadata and reference extraction prompts into one
+        round-trip per article instead of two.
+
+        Args:
+            first_pages (str): Text from the first pages of the article.
+            last_pages (str): Text from the last pages of the article.
+
+        Returns:
+            dict: Dictionary with article metadata and references.
+        """
+        instruction = (
+            f"PRIMEIRAS PÁGINAS:\n{first_pages}\n\nÚLTIMAS PÁGINAS:\n{last_pages}"
+        )
+        combined = self.extract_info_with_ai(self.combined_ai_client, instruction)
+
+        article_dict = combined.get("article") or {}
+        article_dict["references"] = combined.get("references") or []
+        return article_dict
+
     def extract_references_metadata_with_ai(self, last_pages: str) -> Dict:
         """Extracts references using AI.
 
@@ -207,26 +262,29 @@ class ArticleExtractor:
         updated_articles = []
 
         for article in articles_list:
-            # Convert to dictionary for AI compatibility
-            article_dict = article.to_dict()
-
+            # Gate on the Article object directly; most articles need no
+            # completion, and they skip the to_dict round-trip entirely
             if (
-                (article_dict.get("titleOrig") or article_dict.get("titleEn"))
-                and article_dict.get("sectionAbbrev") != "EDT"
-                and self.has_empty_fields(article_dict)
+                (article.title_orig or article.title_en)
+                and article.section_abbrev != "EDT"
+                and self.article_has_empty_fields(article)
             ):
 
                 print(
-                    f"Improving article record with seq {article_dict.get('seq')} and idJEMS: {article_dict.get('idJEMS')}"
+                    f"Improving article record with seq {getattr(article, 'seq', None)} and idJEMS: {article.id_jems}"
                 )
 
-                # Remove fields that don't need to be sent to AI
-                clean_dict = article_dict.copy()
-                clean_dict.pop("firstPages", None)
-                clean_dict.pop("lastPages", None)
+                # Serialize once, excluding fields that don't need to be
+                # sent to AI, in a single pass
+                clean_dict = {
+                    key: value
+                    for key, value in article.to_dict().items()
+                    if key not in ("firstPages", "lastPages")
+                }
 
                 new_dict = self.extract_info_with_ai(
-                    self.field_completion_ai_client, json.dumps(clean_dict)
+                    self.field_completion_ai_client,
+                    orjson.dumps(clean_dict).decode(),
                 )
 
                 if new_dict and isinstance(new_dict, dict):
@@ -240,6 +298,26 @@ class ArticleExtractor:
 
         return updated_articles
 
+    def article_has_empty_fields(self, article: Article) -> bool:
+        """Checks if an Article object has empty fields.
+
+        Same semantics as has_empty_fields, but reads the attributes
+        directly instead of requiring a to_dict() materialization.
+
+        Args:
+            article (Article): Article to check.
+
+        Returns:
+            bool: True if there are empty fields, False otherwise.
+        """
+        for attr in article.attribute_names():
+            if attr in _COMPLETION_SKIP_KEYS:
+                continue
+            value = getattr(article, attr)
+            if not value and value != 0:
+                return True
+        return False
+
     def has_empty_fields(self, dictionary: Dict) -> bool:
         """Checks if the dictionary has empty fields.
 
@@ -249,15 +327,13 @@ class ArticleExtractor:
         Returns:
             bool: True if there are empty fields, False otherwise.
         """
-        for key, value in dictionary.items():
-            # Ignore specific fields and empty lists (which may be valid)
-            if (
-                key not in ["firstPages", "lastPages", "references"]
-                and not value
-                and value != 0
-            ):
-                return True
-        return False
+        # Ignore specific fields and empty lists (which may be valid);
+        # any() short-circuits on the first empty field
+        return any(
+            not value and value != 0
+            for key, value in dictionary.items()
+            if key not in _COMPLETION_SKIP_KEYS
+        )
 
     def extract_info_with_ai(
         self, ai_client: AIClientInterface, instruction: str, recursion_count: int = 0
@@ -276,9 +352,13 @@ class ArticleExtractor:
 
         try:
             return self.parse_ai_response(json_info)
-        except (ValueError, json.JSONDecodeError) as e:
+        except (ValueError, orjson.JSONDecodeError) as e:
             print(f"\n\n\n**** Error decoding JSON: {e} *** \n\n\n")
 
+            # The bad response may have come from (or gone into) the
+            # client's response cache; drop it so the retry hits the API
+            ai_client.invalidate_completion_cache(instruction, True)
+
             # Try again with recursion limit
             if recursion_count < 3:
                 return self.extract_info_with_ai(
@@ -299,12 +379,12 @@ class ArticleExtractor:
 
         Raises:
             ValueError: If valid JSON cannot be found.
-            json.JSONDecodeError: If the found JSON is not valid.
+            orjson.JSONDecodeError: If the found JSON is not valid.
         """
         # Find the JSON part of the string
-        match = re.search(r"\{.*\}|\[.*\]", json_info, re.DOTALL)
+        match = _JSON_RE.search(json_info)
         if not match:
             raise ValueError("Could not find valid JSON in the response")
 
-        # Convert JSON string to dictionary
-        return json.loads(match.group())
+        # Convert JSON string to dictionary (orjson parses at native speed)
+        return orjson.loads(match.group())
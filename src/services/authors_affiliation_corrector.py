@@ -1,6 +1,7 @@
-import numpy as np
+import itertools
 import pandas as pd
 import os
+from concurrent.futures import ThreadPoolExecutor
 from src.adapters.ai_client_interface import AIClientInterface
 from src.services.article_extractor import ArticleExtractor
 from src.config.config_loader import ConfigLoader
@@ -67,7 +68,28 @@ class AuthorsAffiliationCorrector:
             DataFrame: Authors data as a pandas DataFrame
         """
         csv_path = f"{self.folder}/Autores.csv"
-        return pd.read_csv(csv_path, delimiter=";")
+        # The pyarrow engine parses in native code with Arrow-backed
+        # string columns; the explicit schema skips the dtype-inference
+        # pass entirely
+        dtype = {
+            "article": "int64[pyarrow]",
+            "authorFirstName": "string[pyarrow]",
+            "authorMiddleName": "string[pyarrow]",
+            "authorLastName": "string[pyarrow]",
+            "authorAffiliation": "string[pyarrow]",
+            "authorAffiliationEn": "string[pyarrow]",
+            "authorCountry": "string[pyarrow]",
+            "authorEmail": "string[pyarrow]",
+            "orcid": "string[pyarrow]",
+            "order": "int64[pyarrow]",
+        }
+        return pd.read_csv(
+            csv_path,
+            delimiter=";",
+            engine="pyarrow",
+            dtype=dtype,
+            dtype_backend="pyarrow",
+        )
 
     def save_corrected_data(self, authors_df):
         """
@@ -93,8 +115,18 @@ class AuthorsAffiliationCorrector:
         # Reorder the DataFrame columns
         authors_df = authors_df[columns_order]
 
-        # Remove duplicate rows
-        authors_df = authors_df.drop_duplicates()
+        # Remove duplicate rows; the key columns identify an author, so
+        # the long affiliation strings don't need to be hashed
+        authors_df = authors_df.drop_duplicates(
+            subset=[
+                "article",
+                "authorFirstName",
+                "authorLastName",
+                "authorEmail",
+                "orcid",
+            ],
+            keep="first",
+        )
 
         # Generate the CSV file
         authors_df.to_csv(f"{self.folder}/Autores_corrigido.csv", sep=";", index=False)
@@ -109,20 +141,45 @@ class AuthorsAffiliationCorrector:
         Returns:
             list: List of Author domain objects
         """
+        # itertuples yields plain tuples straight from the column arrays,
+        # avoiding the per-row Series construction iterrows pays
+        columns = [
+            "authorFirstName",
+            "authorMiddleName",
+            "authorLastName",
+            "authorAffiliation",
+            "authorAffiliationEn",
+            "authorCountry",
+            "authorEmail",
+            "orcid",
+            "order",
+            "article",
+        ]
         authors = []
-        for _, row in authors_df.iterrows():
+        for (
+            first_name,
+            middle_name,
+            last_name,
+            affiliation,
+            affiliation_en,
+            country,
+            email,
+            orcid,
+            order,
+            article,
+        ) in authors_df[columns].itertuples(index=False, name=None):
             author = Author(
-                first_name=row["authorFirstName"],
-                middle_name=row["authorMiddleName"],
-                last_name=row["authorLastName"],
-                affiliation=row["authorAffiliation"],
-                affiliation_en=row["authorAffiliationEn"],
-                country=row["authorCountry"],
-                email=row["authorEmail"],
-                orcid=row["orcid"],
-                order=row["order"],
+                first_name=first_name,
+                middle_name=middle_name,
+                last_name=last_name,
+                affiliation=affiliation,
+                affiliation_en=affiliation_en,
+                country=country,
+                email=email,
+                orcid=orcid,
+                order=order,
             )
-            author.article_id = row["article"]
+            author.article_id = article
             authors.append(author)
         return authors
 
@@ -137,7 +194,9 @@ class AuthorsAffiliationCorrector:
         Returns:
             list: List of DataFrame chunks
         """
-        return [group for _, group in df.groupby(np.arange(len(df)) // chunk_size)]
+        # Plain iloc slices are zero-copy views; the old groupby built a
+        # hash table and materialized every group just to cut fixed blocks
+        return [df.iloc[i : i + chunk_size] for i in range(0, len(df), chunk_size)]
 
     def merge_and_update_dataframe(self, authors_df, dict_list):
         """
@@ -153,31 +212,18 @@ class AuthorsAffiliationCorrector:
         # Convert dict_list to a DataFrame
         dict_df = pd.DataFrame(dict_list)
 
-        # Rename the affiliation column to avoid conflicts
-        dict_df = dict_df.rename(columns={"authorAffiliation": "newAuthorAffiliation"})
-
-        # Remove the authorAffiliationEn column from authors_df
-        authors_df = authors_df.drop(columns=["authorAffiliationEn"])
-
-        # Merge authors_df and dict_df
-        authors_df = pd.merge(
-            authors_df,
-            dict_df,
-            how="left",
-            left_on="authorAffiliation",
-            right_on="originalAuthorAffiliation",
-        )
-
-        # Drop unnecessary columns
-        authors_df = authors_df.drop(
-            columns=["originalAuthorAffiliation", "authorAffiliation"]
-        )
+        # Two vectorized hash-probe maps keyed on the original affiliation
+        # replace the old left join plus column renames/drops, which
+        # reallocated the whole table. Rows whose affiliation the AI did
+        # not return stay NaN, as with the join; duplicate corrections
+        # can no longer multiply author rows
+        corrections = dict_df.set_index("originalAuthorAffiliation")
+        aff_map = corrections["authorAffiliation"].to_dict()
+        aff_en_map = corrections["authorAffiliationEn"].to_dict()
 
-        # Replace values in the "authorAffiliation" column with values from "newAuthorAffiliation"
-        authors_df["authorAffiliation"] = authors_df["newAuthorAffiliation"]
-
-        # Remove extra columns
-        authors_df = authors_df.drop(columns=["newAuthorAffiliation"])
+        original = authors_df["authorAffiliation"]
+        authors_df["authorAffiliation"] = original.map(aff_map)
+        authors_df["authorAffiliationEn"] = original.map(aff_en_map)
 
         return authors_df
 
@@ -194,19 +240,22 @@ class AuthorsAffiliationCorrector:
         # Load authors data from CSV
         authors_df = self.load_authors_data()
 
-        # Extract only the "authorAffiliation" and "authorAffiliationEn" columns
-        authors_aff_df = authors_df[["authorAffiliation", "authorAffiliationEn"]]
+        # Extract only the "authorAffiliation" and "authorAffiliationEn"
+        # columns; each distinct affiliation needs correcting only once
+        # (a few dozen institutions usually cover hundreds of authors),
+        # so duplicates are dropped before anything is sent to the AI
+        authors_aff_df = authors_df[
+            ["authorAffiliation", "authorAffiliationEn"]
+        ].drop_duplicates(subset=["authorAffiliation"])
 
         # Split authors_aff_df into chunks of number_of_lines rows
         chunks = self.split_into_chunks(authors_aff_df)
 
-        # Initialize an empty list to store results
-        dict_list = []
-
-        # For each chunk, process affiliations with AI
-        for chunk in chunks:
-            result = self.process_affiliation_chunk(chunk)
-            dict_list.extend(result)
+        # Process all chunks concurrently — each one blocks on an AI
+        # round-trip; executor.map keeps the results in submission order
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(self.process_affiliation_chunk, chunks))
+        dict_list = list(itertools.chain.from_iterable(results))
 
         # Merge processed data with original DataFrame
         authors_df = self.merge_and_update_dataframe(authors_df, dict_list)
@@ -12,6 +12,18 @@ from src.domain.article import Article
 import os
 import json
 
+# Fields kept from the website data when merging in the PDF extraction
+_MERGE_EXCLUDED_ATTRS = frozenset(
+    ("id_jems", "section_abbrev", "first_page", "num_pages")
+)
+
+# Declared Article fields to copy from the PDF side, derived once at import
+_MERGE_SLOT_ATTRS = tuple(
+    attr
+    for attr in Article.__slots__
+    if not attr.startswith("_") and attr not in _MERGE_EXCLUDED_ATTRS
+)
+
 
 class Migrator:
     """
@@ -91,10 +103,9 @@ class Migrator:
             num_files
         )
 
-        # 3) Extract article information from PDF text into a list of Article objects
-        pdf_articles_list = self.extractor.extract_articles_data_from_PDF_text(
-            all_files_data
-        )
+        # 3) Extract article information from PDF text; the generator is
+        # consumed directly by the merge step, which only builds a dict
+        pdf_articles_list = self.extractor.iter_articles(all_files_data)
 
         # 4) Merge article information extracted from the website with information from PDFs
         articles_list = self.merge_article_info(
@@ -113,6 +124,12 @@ class Migrator:
         )
         csv_writer.write_dicts_to_csv(articles_list)
 
+        # The raw page texts were only needed for the log snapshot and the
+        # CSV above; drop them to free tens of KB per article
+        for article in articles_list:
+            article.__dict__.pop("firstPages", None)
+            article.__dict__.pop("lastPages", None)
+
         return articles_list
 
     def complete_missing_fields(self, articles_list):
@@ -180,15 +197,12 @@ class Migrator:
                 # Create a base Article from the website data
                 merged_article = Article.from_dict(website_article)
 
-                # Update with PDF article data
+                # Update with PDF article data: the declared fields come
+                # from the precomputed tuple, then the per-instance extras
+                for attr in _MERGE_SLOT_ATTRS:
+                    setattr(merged_article, attr, getattr(pdf_article, attr))
                 for attr, value in pdf_article.__dict__.items():
-                    # Skip certain fields we want to keep from website data
-                    if attr not in [
-                        "id_jems",
-                        "section_abbrev",
-                        "first_page",
-                        "num_pages",
-                    ]:
+                    if not attr.startswith("_") and attr not in _MERGE_EXCLUDED_ATTRS:
                         setattr(merged_article, attr, value)
 
                 # Update pages field
@@ -1,8 +1,42 @@
 import os
-import json
+import orjson
+import fitz
 from pypdf import PdfReader
-from pdfminer.high_level import extract_text_to_fp
-from io import BytesIO
+from pdfminer.converter import TextConverter
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import BytesIO, StringIO
+
+
+def _extract_one(pdf_path, max_pages=-1):
+    """
+    Extract the per-page text of one PDF file.
+
+    Module-level so ProcessPoolExecutor can pickle it for the workers.
+
+    Args:
+        pdf_path (str): The full path of the PDF file.
+        max_pages (int, optional): Number of pages whose text is extracted.
+            Default is -1, which extracts every page.
+
+    Returns:
+        dict: The file data with the keys 'text_pages', 'numPages' and
+             'base_filename' used by process_all_pdfs. 'numPages' is
+             always the total page count, even when max_pages truncates
+             the extracted text.
+    """
+    with fitz.open(pdf_path) as doc:
+        page_count = doc.page_count
+        limit = page_count if max_pages == -1 else min(max_pages, page_count)
+        text_pages = [doc[i].get_text("text") for i in range(limit)]
+    base_filename = os.path.splitext(os.path.basename(pdf_path))[0]
+    return {
+        "text_pages": text_pages,
+        "numPages": page_count,
+        "base_filename": base_filename,
+    }
 
 
 class PDFProcessor:
@@ -19,36 +53,80 @@ class PDFProcessor:
         """
         self.directory = directory
 
-    def extract_text_from_each_page_using_pdfminer(self, pdf_path):
+    def extract_text_from_each_page_using_pymupdf(self, pdf_path):
+        """
+        Extract text from each page of a PDF file using PyMuPDF.
+
+        PyMuPDF extracts the same text several times faster than pdfminer
+        and is already page-scoped, so no form-feed splitting is needed.
+
+        Args:
+            pdf_path (str): The full path of the PDF file.
+
+        Returns:
+            tuple: A tuple containing a list of texts, where each position in the list contains the text of a page
+                  of the PDF, and the total number of pages in the PDF.
+        """
+        with fitz.open(pdf_path) as doc:
+            text_pages = [page.get_text("text") for page in doc]
+        return text_pages, len(text_pages)
+
+    def extract_text_from_each_page_using_pdfminer(self, pdf_path, max_pages=-1):
         """
         Extract text from each page of a PDF file using pdfminer.
 
+        The pages are driven one at a time through a single reused
+        TextConverter, so each page's text is collected directly instead
+        of splitting one giant string on form feeds afterwards.
+
         Args:
             pdf_path (str): The full path of the PDF file.
+            max_pages (int, optional): Number of pages whose text is extracted.
+                Default is -1, which extracts every page.
 
         Returns:
             tuple: A tuple containing a list of texts, where each position in the list contains the text of a page
                   of the PDF, and the total number of pages in the PDF.
         """
+        # Slurp the PDF into memory first: pdfminer's lexer seeks a lot,
+        # and over BytesIO every read is a memory copy instead of a syscall
         with open(pdf_path, "rb") as file:
-            output = BytesIO()
-            extract_text_to_fp(file, output)
-            text = output.getvalue().decode()
-            text_pages = text.split("\x0c")
-            if text_pages[-1] == "":
-                text_pages = text_pages[
-                    :-1
-                ]  # remove the last element if it's an empty string
-            total_pages = len(text_pages)
-            return text_pages, total_pages
-
-    def process_all_pdfs(self, save_files=False, number_of_pages_to_process=1):
+            buffer = BytesIO(file.read())
+            if hasattr(os, "posix_fadvise"):
+                # The PDF won't be read again; let the kernel reclaim its
+                # pages instead of evicting hotter data (Linux only)
+                os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+        rsrcmgr = PDFResourceManager()
+        output = StringIO()
+        device = TextConverter(rsrcmgr, output)
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+
+        text_pages = []
+        total_pages = 0
+        for page in PDFPage.get_pages(buffer):
+            total_pages += 1
+            if max_pages != -1 and len(text_pages) >= max_pages:
+                # Keep walking the page tree for the total count, but
+                # skip the expensive interpretation
+                continue
+            interpreter.process_page(page)
+            text_pages.append(output.getvalue().rstrip("\x0c"))
+            output.seek(0)
+            output.truncate()
+
+        device.close()
+        return text_pages, total_pages
+
+    def process_all_pdfs(self, save_files=False, number_of_pages_to_process=-1):
         """
         Process all PDF files in the specified directory.
 
         Args:
             save_files (bool, optional): Indicates whether text files should be saved. Default is False.
-            number_of_pages_to_process (int, optional): The number of pages to process in each PDF. Default is 1.
+            number_of_pages_to_process (int, optional): The number of pages to process in each PDF.
+                Default is -1, which processes every page; 'numPages' always reports the
+                total page count regardless.
 
         Returns:
             list: A list containing the data of all processed PDF files. Each item in the list is a dictionary
@@ -57,26 +135,35 @@ class PDFProcessor:
                 - 'numPages': The number of pages in the file.
                 - 'base_filename': The filename without the extension.
         """
-        allFilesData = []
-        for filename in os.listdir(self.directory):
-            if filename.endswith(".pdf"):
-                pdf_path = os.path.join(self.directory, filename)
-                text_pages, numPages = self.extract_text_from_each_page_using_pdfminer(
-                    pdf_path
+        # scandir's DirEntry carries the full path and cached file type,
+        # so no extra stat per entry is needed
+        with os.scandir(self.directory) as entries:
+            pdf_paths = [
+                entry.path
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(".pdf")
+            ]
+
+        # Parsing is CPU-bound and independent per file, so fan the PDFs
+        # out across cores; chunksize amortizes the pickling round-trips
+        with ProcessPoolExecutor() as executor:
+            allFilesData = list(
+                executor.map(
+                    partial(_extract_one, max_pages=number_of_pages_to_process),
+                    pdf_paths,
+                    chunksize=4,
                 )
-                # Separate the filename from its extension
-                base_filename = os.path.splitext(filename)[0]
-                fileData = {
-                    "text_pages": text_pages,
-                    "numPages": numPages,
-                    "base_filename": base_filename,
-                }
-                allFilesData.append(fileData)
-                if save_files:
-                    # Save the dictionary to a .json file
-                    os.makedirs("outputs/text", exist_ok=True)
-                    with open("outputs/text/" + base_filename + ".json", "w") as f:
-                        json.dump(fileData, f)
+            )
+
+        if save_files:
+            os.makedirs("outputs/text", exist_ok=True)
+            for fileData in allFilesData:
+                # orjson serializes the page-text arrays in native code,
+                # and the single write lands the whole document at once
+                json_path = "outputs/text/" + fileData["base_filename"] + ".json"
+                with open(json_path, "wb") as f:
+                    f.write(orjson.dumps(fileData, option=orjson.OPT_NON_STR_KEYS))
+
         return allFilesData
 
 
@@ -1,8 +1,19 @@
 # src/utils/text_processor.py (refactored)
+import hashlib
+import logging
 import re
 from src.adapters.ai_client_interface import AIClientInterface
 from typing import Optional, List, Pattern
 
+try:
+    # Optional DFA-based backend: RE2 matches in linear time without
+    # backtracking, which pays off on long extracted pages
+    import re2 as _regex_backend
+except ImportError:
+    _regex_backend = re
+
+logger = logging.getLogger(__name__)
+
 
 class TextProcessor:
     """Utility for processing and cleaning text.
@@ -25,9 +36,14 @@ class TextProcessor:
         "´u",
     ]
 
-    # Compiled regex pattern for better performance
-    _ENCODING_ERROR_REGEX: Pattern = re.compile(
-        "|".join(re.escape(pattern) for pattern in ENCODING_ERROR_PATTERNS)
+    # Cleaning patterns compiled once at class creation; these run on
+    # every page, so the per-call pattern-cache lookup matters
+    _WS_RE: Pattern = _regex_backend.compile(r"\s+")
+
+    # Deletion table for control characters; tab/newline/etc. (0x09-0x0D)
+    # are left in so the whitespace pass still collapses them to a space
+    _CTRL_DELETE = dict.fromkeys(
+        [code for code in range(0x20) if not 0x09 <= code <= 0x0D] + [0x7F]
     )
 
     def __init__(self, ai_client: Optional[AIClientInterface] = None):
@@ -38,6 +54,48 @@ class TextProcessor:
                 text processing. Defaults to None.
         """
         self.ai_client = ai_client
+        # In-process memo of AI corrections keyed by a text hash; broken
+        # fragments repeat across pages (headers, footers), and a hit
+        # here skips even the client's own cache lookup
+        self._correction_cache = {}
+
+    # Deterministic repairs for the known mojibake sequences — they are
+    # all combining-accent artifacts with exactly one correct reading,
+    # so no AI call is needed to fix them
+    _MOJIBAKE_FIX = {
+        "c¸": "ç",
+        "´ı": "í",
+        "´o": "ó",
+        "´e": "é",
+        "˜a": "ã",
+        "˜o": "õ",
+        "¸c": "ç",
+        "´a": "á",
+        "´i": "í",
+        "´u": "ú",
+    }
+
+    # Longest keys first so "c¸˜a" wins over its "¸c"/"˜a" substrings
+    _MOJIBAKE_RE: Pattern = re.compile(
+        "|".join(
+            re.escape(key) for key in sorted(_MOJIBAKE_FIX, key=len, reverse=True)
+        )
+    )
+
+    # Fused cleaning pattern: encoding errors, whitespace runs and
+    # control characters matched in one scan so clean_text touches the
+    # text once instead of three times. Compiled with the stdlib re
+    # module because the replacement relies on ordered alternation
+    # (whitespace before control characters, so tabs still collapse to a
+    # space), which RE2's leftmost-longest semantics would not guarantee.
+    _COMBO_RE: Pattern = re.compile(
+        "("
+        + "|".join(re.escape(pattern) for pattern in ENCODING_ERROR_PATTERNS)
+        + r")|(\s+)|([\x00-\x1F\x7F])"
+    )
+
+    # Delimiter the model is told to preserve between batched pages
+    _PAGE_BOUNDARY = "\n---PAGE_BOUNDARY---\n"
 
     def clean_text(self, text):
         """Cleans the text, removing unwanted characters and normalizing.
@@ -51,12 +109,113 @@ class TextProcessor:
         if not text:
             return ""
 
-        if self.detect_encoding_errors(text):
-            return self.process_with_ai(text)
+        found_encoding_error = False
+
+        def _replace(match):
+            nonlocal found_encoding_error
+            if match.group(1) is not None:
+                found_encoding_error = True
+                return match.group(1)
+            if match.group(2) is not None:
+                return " "
+            return ""
+
+        # One fused scan detects encoding errors while cleaning; the
+        # cleaned text is only discarded when an error reroutes the
+        # original to AI correction
+        cleaned = self._COMBO_RE.sub(_replace, text)
+        if found_encoding_error:
+            # Repair the known sequences deterministically; AI is only
+            # consulted if something the map doesn't cover remains
+            fixed = self.fix_mojibake(text)
+            if self.detect_encoding_errors(fixed):
+                return self.process_with_ai(fixed)
+            return self.basic_cleaning(fixed)
+        return cleaned.strip()
+
+    def clean_texts(self, texts):
+        """Cleans several texts, batching AI corrections into one call.
+
+        Texts with encoding errors are corrected together in a single
+        completion instead of one round-trip each; the others get the
+        same basic cleaning as clean_text.
+
+        Args:
+            texts (list): Texts to be cleaned.
+
+        Returns:
+            list: Cleaned texts, in the same order as the input.
+        """
+        results = [None] * len(texts)
+        broken_indices = []
+        for index, text in enumerate(texts):
+            if not text:
+                results[index] = ""
+            elif self.detect_encoding_errors(text):
+                fixed = self.fix_mojibake(text)
+                if self.detect_encoding_errors(fixed):
+                    broken_indices.append(index)
+                else:
+                    results[index] = self.basic_cleaning(fixed)
+            else:
+                results[index] = self.basic_cleaning(text)
+
+        if broken_indices:
+            corrected = self.process_with_ai_batch(
+                [texts[index] for index in broken_indices]
+            )
+            for index, text in zip(broken_indices, corrected):
+                results[index] = text
 
-        # Basic text cleaning
-        text = self.basic_cleaning(text)
-        return text
+        return results
+
+    def process_with_ai_batch(self, texts):
+        """Corrects several broken texts in a single AI call.
+
+        The texts are joined with a boundary marker the model is asked to
+        preserve, so one completion pays one round-trip for the whole
+        batch. Falls back to per-text processing if the model does not
+        return one segment per input.
+
+        Args:
+            texts (list): Texts with encoding errors to be corrected.
+
+        Returns:
+            list: Corrected texts, in the same order as the input.
+        """
+        if not self.ai_client or len(texts) == 1:
+            return [self.process_with_ai(text) for text in texts]
+
+        instruction = f"""Correct the following texts with encoding errors.
+            Maintain the original meaning, but fix words that have encoding errors.
+            The texts are separated by the marker ---PAGE_BOUNDARY--- which you
+            must keep exactly as it is, in the same positions.
+
+            TEXTS WITH ERROR:
+            {self._PAGE_BOUNDARY.join(texts)}
+            """
+        response = self.ai_client.create_completion(instruction, False)
+        segments = response.split("---PAGE_BOUNDARY---") if response else []
+
+        if len(segments) != len(texts):
+            # The model merged or dropped a boundary; correct one by one
+            return [self.process_with_ai(text) for text in texts]
+
+        return [segment.strip() for segment in segments]
+
+    def fix_mojibake(self, text):
+        """Repairs the known mojibake sequences deterministically.
+
+        Args:
+            text (str): Text with detached combining accents.
+
+        Returns:
+            str: Text with the known sequences replaced by the correct
+                accented characters.
+        """
+        return self._MOJIBAKE_RE.sub(
+            lambda match: self._MOJIBAKE_FIX[match.group()], text
+        )
 
     def basic_cleaning(self, text):
         """Performs basic cleaning on the text.
@@ -67,10 +226,11 @@ class TextProcessor:
         Returns:
             str: Cleaned text.
         """
+        # Remove control characters first — str.translate is a tight C
+        # loop, and the whitespace regex then runs on the smaller text
+        text = text.translate(self._CTRL_DELETE)
         # Remove extra spaces
-        text = re.sub(r"\s+", " ", text)
-        # Remove control characters
-        text = re.sub(r"[\x00-\x1F\x7F]", "", text)
+        text = self._WS_RE.sub(" ", text)
         return text.strip()
 
     def detect_encoding_errors(self, text):
@@ -85,8 +245,10 @@ class TextProcessor:
         if not text:
             return False
 
-        # Check if the text contains any of the patterns using the compiled regular expression
-        return bool(self._ENCODING_ERROR_REGEX.search(text))
+        # The patterns are fixed literals, so plain substring scans beat
+        # the regex alternation: str.__contains__ runs a C fast path and
+        # any() short-circuits on the first hit
+        return any(pattern in text for pattern in self.ENCODING_ERROR_PATTERNS)
 
     def process_with_ai(self, text):
         """Uses the AI client to process text with problems.
@@ -101,6 +263,11 @@ class TextProcessor:
             # If there is no AI client, just do basic cleaning
             return self.basic_cleaning(text)
 
+        cache_key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        corrected_text = self._correction_cache.get(cache_key)
+        if corrected_text is not None:
+            return corrected_text
+
         # Prepare instruction for AI (adapted to the new interface)
         instruction = f"""Correct the following text with encoding errors.
             Maintain the original meaning, but fix words that have encoding errors.
@@ -110,7 +277,12 @@ class TextProcessor:
             """
         corrected_text = self.ai_client.create_completion(instruction, False)
         if not corrected_text:
-            print(f"Error processing text with AI.")
+            logger.warning("Error processing text with AI.")
             return self.basic_cleaning(text)
 
+        if len(self._correction_cache) >= 2048:
+            # Bound the memo; dicts keep insertion order, so this evicts
+            # the oldest entry
+            self._correction_cache.pop(next(iter(self._correction_cache)))
+        self._correction_cache[cache_key] = corrected_text
         return corrected_text